@@ -11,13 +11,13 @@ from datetime import datetime
 import os
 
 # Import custom modules
-from audio_recorder import AudioRecorder, list_audio_devices
-from transcriber import Transcriber
+from audio_recorder import AudioRecorder, list_audio_devices, invalidate_device_cache
 from summarizer import Summarizer
 from config import (
     APP_NAME, APP_VERSION, APP_ICON,
-    RECORDINGS_DIR, TRANSCRIPTS_DIR, SUMMARIES_DIR,
-    GEMINI_API_KEY
+    BASE_DIR, RECORDINGS_DIR, TRANSCRIPTS_DIR, SUMMARIES_DIR,
+    GEMINI_API_KEY, LIVE_TRANSCRIPTION,
+    WHISPER_MODEL, WHISPER_BACKEND, WHISPER_COMPUTE_TYPE, WHISPER_LANGUAGE, WHISPER_BEAM_SIZE
 )
 
 
@@ -37,143 +37,45 @@ st.set_page_config(
 # CUSTOM CSS
 # =============================================================================
 
-st.markdown("""
-<style>
-    /* Main container styling */
-    .main {
-        padding: 1rem 2rem;
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        color: white;
-        text-align: center;
-    }
-    
-    .main-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-    }
-    
-    .main-header p {
-        margin: 0.5rem 0 0 0;
-        opacity: 0.9;
-    }
-    
-    /* Card styling */
-    .status-card {
-        background: #ffffff;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin: 1rem 0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-    
-    .status-card h3 {
-        color: #1a1a2e !important;
-        margin: 0 0 0.5rem 0;
-        font-size: 1.3rem;
-    }
-    
-    .status-card p {
-        color: #333333 !important;
-        margin: 0.3rem 0;
-        font-size: 1rem;
-    }
-    
-    .recording-active {
-        background: #ffe8e8;
-        border-left-color: #e74c3c;
-        animation: pulse 2s infinite;
-    }
-    
-    .recording-active h3 {
-        color: #c0392b !important;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.85; }
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        border-radius: 25px;
-        padding: 0.5rem 2rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-    
-    /* Summary box */
-    .summary-box {
-        background: linear-gradient(135deg, #f5f7fa 0%, #e4e8ec 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-    }
-    
-    /* Progress indicator */
-    .processing-indicator {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        padding: 1rem;
-        background: #e8f4f8;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: #f8f9fa;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #667eea;
-    }
-    
-    .metric-label {
-        color: #666;
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the app stylesheet once per server process."""
+    return (BASE_DIR / "static" / "styles.css").read_text(encoding='utf-8')
+
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+# =============================================================================
+# SHARED RESOURCES
+# =============================================================================
+
+@st.cache_resource
+def get_recorder():
+    """Audio recorder shared across all sessions and reruns."""
+    return AudioRecorder()
+
+
+@st.cache_resource(show_spinner="🔄 Loading Whisper model (first time only)...")
+def get_transcriber():
+    """Whisper model loaded once and shared across all sessions and reruns."""
+    # Imported here so reruns that never transcribe don't pay for it
+    from transcriber import Transcriber
+    transcriber = Transcriber()
+    transcriber.warmup()  # Load and run the model now, while the spinner is shown
+    return transcriber
+
+
+@st.cache_resource
+def get_summarizer():
+    """Gemini summarizer shared across all sessions and reruns."""
+    return Summarizer()
 
 
 # =============================================================================
 # SESSION STATE INITIALIZATION
 # =============================================================================
 
-if 'recorder' not in st.session_state:
-    st.session_state.recorder = AudioRecorder()
-    
-if 'transcriber' not in st.session_state:
-    st.session_state.transcriber = None  # Lazy load (heavy model)
-    
-if 'summarizer' not in st.session_state:
-    st.session_state.summarizer = Summarizer()
-    
 if 'is_recording' not in st.session_state:
     st.session_state.is_recording = False
 
@@ -186,22 +88,14 @@ if 'current_summary' not in st.session_state:
 if 'last_audio_file' not in st.session_state:
     st.session_state.last_audio_file = ""
     
-if 'recording_start_time' not in st.session_state:
-    st.session_state.recording_start_time = None
+if 'live_result' not in st.session_state:
+    st.session_state.live_result = None
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def load_transcriber():
-    """Lazy load the Whisper model."""
-    if st.session_state.transcriber is None:
-        with st.spinner("🔄 Loading Whisper model (first time only)..."):
-            st.session_state.transcriber = Transcriber()
-    return st.session_state.transcriber
-
-
 def format_duration(seconds):
     """Format seconds to MM:SS."""
     mins = int(seconds // 60)
@@ -209,6 +103,23 @@ def format_duration(seconds):
     return f"{mins:02d}:{secs:02d}"
 
 
+# Settings that change the transcript: cached results for other values are not reused
+MODEL_KEY = (WHISPER_MODEL, WHISPER_BACKEND, WHISPER_COMPUTE_TYPE, WHISPER_LANGUAGE, WHISPER_BEAM_SIZE)
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def cached_transcribe(audio_hash: str, model_key: tuple, _audio_path: str) -> dict:
+    """Transcribe a recording; results are kept on disk keyed by audio content and model settings."""
+    return get_transcriber().transcribe(_audio_path)
+
+
+def transcribe_recording(audio_path: str) -> dict:
+    """Transcribe a recording, reusing the result if it was transcribed before."""
+    from transcriber import audio_fingerprint
+    return cached_transcribe(audio_fingerprint(audio_path), MODEL_KEY, audio_path)
+
+
+@st.cache_data(ttl=10)
 def get_recording_stats():
     """Get statistics about recordings."""
     recordings = list(RECORDINGS_DIR.glob("*.wav"))
@@ -217,6 +128,44 @@ def get_recording_stats():
     return len(recordings), len(transcripts), len(summaries)
 
 
+@st.cache_data(ttl=60)
+def get_input_devices():
+    """Get available audio input devices (querying PortAudio is slow)."""
+    return get_recorder().get_audio_devices()
+
+
+@st.cache_data
+def read_summary(path: str, mtime: float) -> str:
+    """Read a summary file (cached until the file's mtime changes)."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@st.fragment(run_every="1s")
+def recording_status():
+    """Recording card with live timer; reruns on its own every second."""
+    # Audio actually captured, counted by the recorder's callback
+    elapsed = get_recorder().get_recording_duration()
+    hours = int(elapsed // 3600)
+    minutes = int((elapsed % 3600) // 60)
+    seconds = int(elapsed % 60)
+    duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes:02d}:{seconds:02d}"
+
+    st.markdown(f"""
+    <div style="background-color: #ffcdd2 !important; padding: 1.5rem; border-radius: 12px; border-left: 6px solid #e74c3c; margin: 1rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.2);">
+        <span style="display: block; color: #b71c1c !important; margin: 0 0 0.5rem 0; font-size: 1.4rem; font-weight: 700;">🔴 Recording in Progress</span>
+        <div style="background-color: #ffffff !important; padding: 0.8rem 1.2rem; border-radius: 8px; display: inline-block; margin: 0.5rem 0; box-shadow: 0 2px 6px rgba(0,0,0,0.15);">
+            <span style="color: #c62828 !important; font-size: 2rem; font-weight: bold; font-family: 'Courier New', monospace; letter-spacing: 2px;">⏱️ {duration_str}</span>
+        </div>
+        <span style="display: block; color: #5d4037 !important; margin: 0.5rem 0 0 0; font-size: 0.95rem;">Click "Stop Recording" when your meeting ends</span>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Live transcript preview
+    partial_transcript = get_recorder().get_partial_transcript()
+    if partial_transcript:
+        st.caption(f"📝 {partial_transcript[-500:]}")
+
+
 # =============================================================================
 # SIDEBAR
 # =============================================================================
@@ -228,7 +177,7 @@ with st.sidebar:
     
     # API Status
     st.markdown("### 🔑 API Status")
-    if st.session_state.summarizer.is_configured():
+    if get_summarizer().is_configured():
         st.success("✅ Gemini API Connected")
     else:
         st.warning("⚠️ Gemini API Not Configured")
@@ -259,7 +208,7 @@ with st.sidebar:
     st.markdown("### 🎧 Audio Settings")
     
     try:
-        devices = st.session_state.recorder.get_audio_devices()
+        devices = get_input_devices()
         if devices:
             device_names = [f"{d['id']}: {d['name']}" for d in devices]
             selected_device = st.selectbox(
@@ -268,12 +217,19 @@ with st.sidebar:
                 format_func=lambda x: device_names[x],
                 help="Select the audio device to record from. For system audio, select 'Stereo Mix' or virtual audio cable."
             )
-            st.session_state.recorder.set_device(devices[selected_device]['id'])
+            get_recorder().set_device(devices[selected_device]['id'])
         else:
             st.error("No audio input devices found!")
     except Exception as e:
         st.error(f"Error loading audio devices: {e}")
     
+    if st.button("🔄 Refresh Devices", disabled=st.session_state.is_recording):
+        if invalidate_device_cache():
+            get_input_devices.clear()
+            st.rerun()
+        else:
+            st.warning("Stop the recording before refreshing devices.")
+    
     st.divider()
     
     # Quick Links
@@ -307,15 +263,16 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Main tabs
-tab1, tab2, tab3 = st.tabs(["🎙️ Record Meeting", "📜 History", "ℹ️ Help"])
+# Main views (a radio instead of st.tabs, so only the selected view runs)
+VIEWS = ["🎙️ Record Meeting", "📜 History", "ℹ️ Help"]
+view = st.radio("View", VIEWS, horizontal=True, label_visibility="collapsed", key="view")
 
 
 # =============================================================================
 # TAB 1: RECORD MEETING
 # =============================================================================
 
-with tab1:
+if view == VIEWS[0]:
     # Recording Controls
     col1, col2, col3 = st.columns([1, 2, 1])
     
@@ -324,25 +281,7 @@ with tab1:
         
         # Status indicator with live timer
         if st.session_state.is_recording:
-            elapsed = time.time() - st.session_state.recording_start_time if st.session_state.recording_start_time else 0
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes:02d}:{seconds:02d}"
-            
-            st.markdown(f"""
-            <div style="background-color: #ffcdd2 !important; padding: 1.5rem; border-radius: 12px; border-left: 6px solid #e74c3c; margin: 1rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.2);">
-                <span style="display: block; color: #b71c1c !important; margin: 0 0 0.5rem 0; font-size: 1.4rem; font-weight: 700;">🔴 Recording in Progress</span>
-                <div style="background-color: #ffffff !important; padding: 0.8rem 1.2rem; border-radius: 8px; display: inline-block; margin: 0.5rem 0; box-shadow: 0 2px 6px rgba(0,0,0,0.15);">
-                    <span style="color: #c62828 !important; font-size: 2rem; font-weight: bold; font-family: 'Courier New', monospace; letter-spacing: 2px;">⏱️ {duration_str}</span>
-                </div>
-                <span style="display: block; color: #5d4037 !important; margin: 0.5rem 0 0 0; font-size: 0.95rem;">Click "Stop Recording" when your meeting ends</span>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Auto-refresh every 1 second to update timer
-            time.sleep(1)
-            st.rerun()
+            recording_status()
         else:
             st.markdown("""
             <div style="background-color: #f0f4ff !important; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #667eea; margin: 1rem 0; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
@@ -359,10 +298,16 @@ with tab1:
                         disabled=st.session_state.is_recording,
                         use_container_width=True,
                         type="primary"):
-                success = st.session_state.recorder.start_recording()
+                # Capture starts first: loading Whisper must not delay or block the recording
+                success = get_recorder().start_recording()
                 if success:
                     st.session_state.is_recording = True
-                    st.session_state.recording_start_time = time.time()
+                    if LIVE_TRANSCRIPTION and get_recorder().streamer is None:
+                        try:
+                            get_recorder().start_live_transcription(get_transcriber())
+                        except Exception as e:
+                            st.toast(f"⚠️ Live transcription unavailable ({e}), "
+                                     "the recording will be transcribed when you process it")
                     st.rerun()
                 else:
                     st.error("Failed to start recording!")
@@ -376,12 +321,13 @@ with tab1:
                 meeting_name = datetime.now().strftime("meeting_%Y%m%d_%H%M%S")
                 
                 with st.spinner("💾 Saving recording..."):
-                    audio_path = st.session_state.recorder.stop_recording(meeting_name)
+                    audio_path = get_recorder().stop_recording(meeting_name)
                 
                 if audio_path:
                     st.session_state.is_recording = False
                     st.session_state.last_audio_file = audio_path
-                    st.session_state.recording_start_time = None
+                    st.session_state.live_result = get_recorder().get_transcription()
+                    get_recording_stats.clear()
                     st.success(f"✅ Recording saved: {Path(audio_path).name}")
                     st.rerun()
                 else:
@@ -408,28 +354,29 @@ with tab1:
             progress = st.progress(0, text="🎯 Starting transcription...")
             
             try:
-                transcriber = load_transcriber()
+                transcriber = get_transcriber()
                 progress.progress(20, text="📝 Transcribing audio (this may take a while)...")
                 
-                result = transcriber.transcribe(st.session_state.last_audio_file)
+                # Reuse the transcript produced while recording, if any
+                result = st.session_state.live_result
+                if not result or not result['text']:
+                    result = transcribe_recording(st.session_state.last_audio_file)
                 st.session_state.current_transcript = result['text']
                 
                 progress.progress(60, text="🤖 Generating AI summary...")
                 
-                # Step 2: Summarize
-                summary = st.session_state.summarizer.summarize(result['text'])
-                st.session_state.current_summary = summary
-                
-                # Save files
+                # Step 2: Summarize while the transcript is saved in the background
                 meeting_name = Path(st.session_state.last_audio_file).stem
-                transcriber.transcribe_and_save(
-                    st.session_state.last_audio_file, 
-                    meeting_name
-                )
-                st.session_state.summarizer.summarize_and_save(
-                    result['text'], 
-                    meeting_name
+                saved = transcriber.save_transcript(result, meeting_name, background=True)
+                summary = st.write_stream(
+                    get_summarizer().summarize_stream(result['text'])
                 )
+                saved["save_future"].result()
+                st.session_state.current_summary = summary
+                
+                # Save summary
+                get_summarizer().save_summary(summary, meeting_name)
+                get_recording_stats.clear()
                 
                 progress.progress(100, text="✅ Complete!")
                 time.sleep(0.5)
@@ -496,7 +443,9 @@ with tab1:
 # TAB 2: HISTORY
 # =============================================================================
 
-with tab2:
+@st.fragment
+def meeting_history():
+    """List past summaries; reruns on its own when its widgets are used."""
     st.markdown("### 📜 Meeting History")
     
     # List all summaries
@@ -505,7 +454,7 @@ with tab2:
     if summaries:
         for summary_file in summaries[:10]:  # Show last 10
             with st.expander(f"📋 {summary_file.stem}"):
-                content = summary_file.read_text(encoding='utf-8')
+                content = read_summary(str(summary_file), summary_file.stat().st_mtime)
                 st.markdown(content)
                 
                 col1, col2 = st.columns(2)
@@ -521,11 +470,15 @@ with tab2:
         st.info("No meeting summaries yet. Record and process your first meeting!")
 
 
+if view == VIEWS[1]:
+    meeting_history()
+
+
 # =============================================================================
 # TAB 3: HELP
 # =============================================================================
 
-with tab3:
+if view == VIEWS[2]:
     st.markdown("""
     ### 📖 How to Use
     
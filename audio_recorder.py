@@ -4,14 +4,14 @@ Google Meet Summarizer - Audio Recorder Module
 Handles system audio capture for recording Google Meet sessions.
 """
 
-import numpy as np
 import sounddevice as sd
-from scipy.io.wavfile import write
+import soundfile as sf
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict
 import threading
-import queue
+import functools
+import weakref
 
 from config import RECORDINGS_DIR, SAMPLE_RATE, CHANNELS, DTYPE
 
@@ -32,15 +32,24 @@ class AudioRecorder:
         Initialize the audio recorder.
         
         Args:
-            sample_rate: Audio sample rate in Hz (default: 44100)
-            channels: Number of audio channels (default: 2 for stereo)
+            sample_rate: Audio sample rate in Hz (default: 16000)
+            channels: Number of audio channels (default: 1 for mono)
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        # Format actually opened on the device (see _negotiate_format)
+        self.stream_sample_rate = sample_rate
+        self.stream_channels = channels
         self.is_recording = False
-        self.audio_queue = queue.Queue()
+        self._sf: Optional[sf.SoundFile] = None  # WAV file being written
+        self._filepath: Optional[Path] = None
+        self._frames_written = 0
         self.recording_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self.current_device: Optional[int] = None
+        self.transcriber = None
+        self.streamer = None  # TranscriptionStreamer while live transcribing
+        _recorders.add(self)
         
     def get_audio_devices(self) -> List[Dict]:
         """
@@ -49,7 +58,7 @@ class AudioRecorder:
         Returns:
             List of dictionaries containing device info
         """
-        devices = sd.query_devices()
+        devices = _cached_query_devices()
         input_devices = []
         
         for i, device in enumerate(devices):
@@ -79,27 +88,98 @@ class AudioRecorder:
         """
         self.current_device = device_id
         
+    def set_transcriber(self, transcriber) -> None:
+        """
+        Enable live transcription while recording.
+        
+        Args:
+            transcriber: Loaded Transcriber, or None to disable live transcription
+        """
+        self.transcriber = transcriber
+        
+    def start_live_transcription(self, transcriber) -> None:
+        """
+        Enable live transcription and attach it to the running recording.
+        
+        Audio captured before this call is missing from the live transcript,
+        so get_transcription() returns None for this recording and the file
+        is transcribed instead. Later recordings are transcribed from the start.
+        
+        Args:
+            transcriber: Loaded Transcriber
+        """
+        self.transcriber = transcriber
+        if not self.is_recording or self.streamer is not None:
+            return
+        
+        from transcriber import TranscriptionStreamer
+        streamer = TranscriptionStreamer(
+            transcriber, self.stream_sample_rate, self.stream_channels
+        )
+        streamer.complete = False
+        streamer.start()
+        self.streamer = streamer  # The audio callback starts feeding it from here
+        
     def _audio_callback(self, indata, frames, time, status):
         """Callback function for audio stream."""
         if status:
             print(f"Audio callback status: {status}")
-        self.audio_queue.put(indata.copy())
+            
+        # Stream PCM frames straight to the WAV file
+        self._sf.write(indata)
+        self._frames_written += frames
+        
+        if self.streamer:
+            self.streamer.feed(indata)
         
     def _recording_worker(self):
         """Worker thread that handles audio recording."""
+        # Keep our own references: a later recording replaces the attributes
+        wav_file = self._sf
+        streamer = self.streamer
         try:
             with sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
+                samplerate=self.stream_sample_rate,
+                channels=self.stream_channels,
                 dtype=DTYPE,
                 device=self.current_device,
                 callback=self._audio_callback
             ):
-                while self.is_recording:
-                    sd.sleep(100)  # Sleep for 100ms
+                # Block until stop_recording() (the callback does all the work)
+                self._stop_event.wait()
         except Exception as e:
             print(f"Recording error: {e}")
             self.is_recording = False
+            # Transcribe what was captured before the stream failed
+            if streamer:
+                streamer.finish()
+        finally:
+            # The stream is closed here, so the callback no longer writes to the file
+            wav_file.close()
+    
+    def _negotiate_format(self) -> None:
+        """
+        Pick the capture format for the selected device.
+        
+        Uses the configured sample rate and channels when the driver
+        supports them, otherwise falls back to the device's native format
+        (the transcriber resamples to 16kHz mono when loading the file).
+        """
+        self.stream_sample_rate = self.sample_rate
+        self.stream_channels = self.channels
+        try:
+            sd.check_input_settings(
+                device=self.current_device,
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=DTYPE
+            )
+        except Exception as e:
+            info = sd.query_devices(self.current_device, 'input')
+            self.stream_sample_rate = int(info['default_samplerate'])
+            self.stream_channels = min(self.channels, info['max_input_channels']) or 1
+            print(f"⚠️ Device does not support {self.sample_rate} Hz / {self.channels} ch ({e}), "
+                  f"recording at {self.stream_sample_rate} Hz / {self.stream_channels} ch")
     
     def start_recording(self, device_id: Optional[int] = None) -> bool:
         """
@@ -111,7 +191,7 @@ class AudioRecorder:
         Returns:
             True if recording started successfully, False otherwise
         """
-        if self.is_recording:
+        if self.is_recording or (self.recording_thread and self.recording_thread.is_alive()):
             print("Already recording!")
             return False
             
@@ -119,14 +199,39 @@ class AudioRecorder:
         if device_id is not None:
             self.current_device = device_id
             
-        # Clear the queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Choose the capture format supported by the device
+        try:
+            self._negotiate_format()
+        except Exception as e:
+            print(f"Could not query audio device: {e}")
+            return False
+            
+        # Open the WAV file; audio is written to it while recording
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._filepath = RECORDINGS_DIR / f"meeting_{timestamp}.wav"
+        try:
+            self._sf = sf.SoundFile(
+                str(self._filepath), 'w',
+                samplerate=self.stream_sample_rate,
+                channels=self.stream_channels,
+                subtype='PCM_16'
+            )
+        except Exception as e:
+            print(f"Could not create recording file: {e}")
+            return False
+        self._frames_written = 0
+                
+        # Start live transcription
+        self.streamer = None
+        if self.transcriber is not None:
+            from transcriber import TranscriptionStreamer
+            self.streamer = TranscriptionStreamer(
+                self.transcriber, self.stream_sample_rate, self.stream_channels
+            )
+            self.streamer.start()
                 
         # Start recording
+        self._stop_event.clear()
         self.is_recording = True
         self.recording_thread = threading.Thread(target=self._recording_worker)
         self.recording_thread.start()
@@ -144,40 +249,38 @@ class AudioRecorder:
         Returns:
             Path to the saved audio file, or None if recording failed
         """
-        if not self.is_recording:
+        # The worker thread is kept until here even if the stream failed,
+        # so the audio captured before the error is still saved
+        if self.recording_thread is None:
             print("Not currently recording!")
             return None
             
         # Stop recording
         self.is_recording = False
+        self._stop_event.set()
         
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2.0)
-            
-        # Collect all audio data from queue
-        audio_chunks = []
-        while not self.audio_queue.empty():
-            try:
-                chunk = self.audio_queue.get_nowait()
-                audio_chunks.append(chunk)
-            except queue.Empty:
-                break
-                
-        if not audio_chunks:
-            print("No audio data recorded!")
+        # The worker closes the WAV file once the audio stream is closed
+        self.recording_thread.join(timeout=5.0)
+        if self.recording_thread.is_alive():
+            print("⚠️ Audio stream did not close yet, try stopping again")
             return None
+        self.recording_thread = None
+        self._sf = None
             
-        # Concatenate audio chunks
-        audio_data = np.concatenate(audio_chunks, axis=0)
+        # Transcribe the audio still buffered by the live transcriber
+        if self.streamer:
+            print("📝 Finishing live transcription...")
+            self.streamer.finish()
+        filepath = self._filepath
         
-        # Generate filename if not provided
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"meeting_{timestamp}"
+        if self._frames_written == 0:
+            print("No audio data recorded!")
+            filepath.unlink(missing_ok=True)
+            return None
             
-        # Save audio file
-        filepath = RECORDINGS_DIR / f"{filename}.wav"
-        write(str(filepath), self.sample_rate, audio_data)
+        # Rename to the custom filename if provided
+        if filename is not None:
+            filepath = filepath.replace(RECORDINGS_DIR / f"{filename}.wav")
         
         print(f"✅ Recording saved: {filepath}")
         return str(filepath)
@@ -192,8 +295,25 @@ class AudioRecorder:
         if not self.is_recording:
             return 0.0
             
-        # Estimate based on queue size (approximate)
-        return self.audio_queue.qsize() * 0.1  # Each chunk is ~100ms
+        return self._frames_written / self.stream_sample_rate
+    
+    def get_partial_transcript(self) -> str:
+        """Get the live transcript of the current (or last) recording."""
+        if self.streamer is None:
+            return ""
+        return self.streamer.get_partial_transcript()
+    
+    def get_transcription(self) -> Optional[Dict]:
+        """
+        Get the live transcription of the last recording.
+        
+        Returns:
+            Transcription dictionary, or None if live transcription was
+            disabled or could not keep up with the recording
+        """
+        if self.streamer is None or not self.streamer.complete:
+            return None
+        return self.streamer.get_result()
     
     def is_currently_recording(self) -> bool:
         """Check if currently recording."""
@@ -204,12 +324,43 @@ class AudioRecorder:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# All recorders, so the device rescan can tell whether a stream is open
+_recorders: "weakref.WeakSet[AudioRecorder]" = weakref.WeakSet()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_query_devices() -> tuple:
+    """Query PortAudio devices once (enumeration can take hundreds of ms)."""
+    return tuple(sd.query_devices())
+
+
+def invalidate_device_cache() -> bool:
+    """
+    Forget the cached device list and re-scan audio devices.
+    
+    Call this after plugging in or removing an audio device. Re-initializing
+    PortAudio would kill an open stream, so nothing is done while recording.
+    
+    Returns:
+        True if the devices were re-scanned, False if a recording is running
+    """
+    if any(r.recording_thread and r.recording_thread.is_alive() for r in list(_recorders)):
+        print("⚠️ Cannot refresh audio devices while recording")
+        return False
+    
+    _cached_query_devices.cache_clear()
+    # PortAudio only sees new devices after it is re-initialized
+    sd._terminate()
+    sd._initialize()
+    return True
+
+
 def list_audio_devices():
     """Print all available audio devices."""
     print("\n🎧 Available Audio Devices:")
     print("=" * 60)
     
-    devices = sd.query_devices()
+    devices = _cached_query_devices()
     for i, device in enumerate(devices):
         device_type = []
         if device['max_input_channels'] > 0:
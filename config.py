@@ -23,6 +23,10 @@ RECORDINGS_DIR = BASE_DIR / "recordings"
 TRANSCRIPTS_DIR = BASE_DIR / "transcripts"
 SUMMARIES_DIR = BASE_DIR / "summaries"
 
+# Optional pre-converted CTranslate2 Whisper models (see README)
+# A model in MODELS_DIR / "whisper-<size>-ct2" is used instead of downloading one
+MODELS_DIR = BASE_DIR / "models"
+
 # Create directories if they don't exist
 for directory in [RECORDINGS_DIR, TRANSCRIPTS_DIR, SUMMARIES_DIR]:
     directory.mkdir(exist_ok=True)
@@ -32,8 +36,11 @@ for directory in [RECORDINGS_DIR, TRANSCRIPTS_DIR, SUMMARIES_DIR]:
 # =============================================================================
 
 # Audio recording settings
-SAMPLE_RATE = 44100  # Hz - CD quality audio
-CHANNELS = 2         # Stereo recording
+# Whisper works on 16kHz mono audio, so capture in that format directly
+# (the sound driver downsamples, ~6x less data than 48kHz stereo).
+# Raise these only if you need high-fidelity recordings for archival.
+SAMPLE_RATE = 16000  # Hz - Whisper's native rate
+CHANNELS = 1         # Mono recording
 DTYPE = "int16"      # Audio data type
 
 # =============================================================================
@@ -50,6 +57,76 @@ DTYPE = "int16"      # Audio data type
 # - large:  ~10GB RAM, most accurate
 WHISPER_MODEL = "base"
 
+# Transcription backend
+# Options: "faster-whisper", "openai-whisper"
+# - faster-whisper: CTranslate2 runtime with quantized weights (recommended)
+# - openai-whisper: reference PyTorch implementation (used as a fallback
+#                   when faster-whisper is not installed)
+WHISPER_BACKEND = "faster-whisper"
+
+# Device used for transcription
+# Options: "auto" (GPU when CUDA is available), "cuda", "cpu"
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
+
+# Weight precision used by the faster-whisper backend
+# Options: "auto", "int8", "int8_float16", "float16", "float32"
+# - auto:         int8 on CPU, int8_float16 on GPU
+# - int8:         8-bit weights, fastest on CPU and about half the RAM
+# - int8_float16: 8-bit weights with float16 activations (GPU only)
+# - float16:      half precision (GPU only)
+# - float32:      full precision, slowest (for accuracy-sensitive use)
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
+
+# Language spoken in the meetings, e.g. "en" (empty = auto-detect)
+# Detection costs an extra encoder pass; when auto-detecting, it runs once per
+# recording (live chunks and batches reuse the language of their first part)
+WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE") or None
+
+# CPU threads used by faster-whisper (0 = one per CPU core)
+# CTranslate2 uses only 4 threads unless told otherwise
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+
+# Number of 30 second audio chunks decoded together by faster-whisper
+# Higher values are faster on long recordings but use more memory
+# (set to 1 to disable batched transcription)
+WHISPER_BATCH_SIZE = 8
+
+# Beam search width used when decoding
+# 1 = greedy decoding: several times fewer decoder passes than a beam of 5,
+# with nearly the same accuracy on meeting speech
+WHISPER_BEAM_SIZE = 1
+
+# Compile the encoder with torch.compile (openai-whisper backend on GPU only)
+# Faster transcription after a one-time compile when the model is loaded
+WHISPER_COMPILE = True
+
+# Voice activity detection (faster-whisper backend)
+# Silent stretches longer than this are skipped before transcription
+VAD_MIN_SILENCE_MS = 500
+
+# Audio kept on each side of detected speech, so word onsets and endings
+# are not clipped (faster-whisper's default of 400ms encodes more silence)
+VAD_SPEECH_PAD_MS = 200
+
+# Live transcription
+# Transcribe audio in the background while recording, so most of the
+# transcript is ready by the time the meeting ends
+LIVE_TRANSCRIPTION = True
+
+# Seconds of audio buffered before a live chunk is transcribed.
+# Chunks are cut on pauses in speech, and never exceed the maximum
+# (Whisper processes audio in 30 second windows)
+STREAM_MIN_SECONDS = 10
+STREAM_MAX_SECONDS = 30
+
+# Seconds of recorded audio the live transcriber can fall behind by
+# before it gives up (the full recording is then transcribed at the end)
+STREAM_RING_SECONDS = 120
+
+# Long recordings processed with pipeline.py are split into parts of about
+# this many seconds; each part is summarized while the next is transcribed
+PIPELINE_CHUNK_SECONDS = 600
+
 # =============================================================================
 # GEMINI API CONFIGURATION
 # =============================================================================
@@ -0,0 +1,163 @@
+"""
+Google Meet Summarizer - Pipeline Module
+========================================
+Transcribes and summarizes long recordings part by part, so Gemini
+summarizes one part while Whisper transcribes the next.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import PIPELINE_CHUNK_SECONDS, VAD_MIN_SILENCE_MS, VAD_SPEECH_PAD_MS
+from summarizer import Summarizer
+from transcriber import Transcriber
+
+
+def transcribe_and_summarize_streaming(
+    audio_path: str,
+    transcriber: Optional[Transcriber] = None,
+    summarizer: Optional[Summarizer] = None,
+    chunk_seconds: int = PIPELINE_CHUNK_SECONDS
+) -> Dict:
+    """
+    Transcribe and summarize a recording with the two stages overlapped.
+    
+    The recording is split into parts of about chunk_seconds, cut in pauses
+    between speech. Each part is summarized in the background as soon as
+    it is transcribed, while the GPU/CPU moves on to the next part.
+    
+    Args:
+        audio_path: Path to the audio file
+        transcriber: Transcriber to use (a new one is created if None)
+        summarizer: Summarizer to use (a new one is created if None)
+        chunk_seconds: Approximate length of each part in seconds
+    
+    Returns:
+        Dictionary with 'transcription' (same format as
+        Transcriber.transcribe()) and the merged 'summary' text
+    """
+    if not Path(audio_path).exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    transcriber = transcriber or Transcriber()
+    summarizer = summarizer or Summarizer()
+    
+    audio = transcriber._prepare_audio(audio_path)
+    if isinstance(audio, str):
+        # Not decodable here (non-WAV file): process it in one piece
+        transcription = transcriber.transcribe(audio_path)
+        return {
+            "transcription": transcription,
+            "summary": summarizer.summarize(transcription["text"])
+        }
+    
+    bounds = [0, *_split_points(audio, chunk_seconds * 16000), len(audio)]
+    print(f"🔀 Processing {len(bounds) - 1} part(s) of ~{chunk_seconds // 60} min")
+    
+    language = None
+    segments = []
+    parts = []  # (start, end, summary future) per part with speech
+    
+    with ThreadPoolExecutor(max_workers=2) as summary_pool:
+        for start, end in zip(bounds, bounds[1:]):
+            result = transcriber.transcribe_array(audio[start:end], language=language)
+            # Keep the language of the first part for the rest of the meeting
+            if language is None and result["language"] != "unknown":
+                language = result["language"]
+            
+            offset = start / 16000
+            text = []
+            for segment in result["segments"]:
+                if segment["text"]:
+                    segments.append({
+                        "id": len(segments),
+                        "start": offset + segment["start"],
+                        "end": offset + segment["end"],
+                        "text": segment["text"]
+                    })
+                    text.append(segment["text"])
+            
+            if text:
+                # Gemini works on this part while the next one is transcribed
+                parts.append((
+                    offset,
+                    end / 16000,
+                    summary_pool.submit(summarizer.summarize, " ".join(text))
+                ))
+        
+        summaries = [(start, end, future.result()) for start, end, future in parts]
+    
+    transcription = {
+        "text": " ".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": language or "unknown",
+        "duration": segments[-1]["end"] if segments else 0
+    }
+    
+    return {
+        "transcription": transcription,
+        "summary": _merge_summaries(summaries)
+    }
+
+
+def _split_points(audio_16k: np.ndarray, chunk_samples: int) -> List[int]:
+    """
+    Find sample positions that split audio into parts of about chunk_samples.
+    
+    Cuts are placed in the middle of pauses between speech regions (Silero
+    VAD), so no utterance is split in half.
+    """
+    try:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+    except ImportError:
+        # No VAD available: fall back to fixed-size parts
+        return list(range(chunk_samples, len(audio_16k), chunk_samples))
+    
+    speech = get_speech_timestamps(
+        audio_16k,
+        vad_options=VadOptions(
+            min_silence_duration_ms=VAD_MIN_SILENCE_MS,
+            speech_pad_ms=VAD_SPEECH_PAD_MS
+        )
+    )
+    
+    cuts = []
+    part_start = 0
+    for previous, current in zip(speech, speech[1:]):
+        # Start a new part rather than let this speech region overflow the current one
+        if current["end"] - part_start > chunk_samples:
+            cut = (previous["end"] + current["start"]) // 2
+            cuts.append(cut)
+            part_start = cut
+    
+    return cuts
+
+
+def _merge_summaries(summaries: List) -> str:
+    """Combine (start, end, summary) parts into one summary document."""
+    if len(summaries) == 1:
+        return summaries[0][2]
+    
+    sections = []
+    for start, end, summary in summaries:
+        span = f"{Transcriber._format_time(start)} - {Transcriber._format_time(end)}"
+        sections.append(f"# Part {len(sections) + 1} ({span})\n\n{summary.strip()}")
+    
+    return "\n\n".join(sections)
+
+
+if __name__ == "__main__":
+    print("\n🔀 Transcribe & Summarize Pipeline")
+    print("=" * 40)
+    
+    recordings = sorted(Path("recordings").glob("*.wav"))
+    if recordings:
+        print(f"\nProcessing {recordings[-1].name}...")
+        output = transcribe_and_summarize_streaming(str(recordings[-1]))
+        print("\n--- Summary ---")
+        print(output["summary"])
+    else:
+        print("\nNo recordings found. Record a meeting first!")
@@ -0,0 +1,66 @@
+"""
+Google Meet Summarizer - Whisper Model Converter
+================================================
+Converts an OpenAI Whisper model to a CTranslate2 model with int8 weights
+and stores it in models/, where the transcriber picks it up automatically.
+
+Usage:
+    pip install transformers[torch]
+    python scripts/convert_model.py            # WHISPER_MODEL from config.py
+    python scripts/convert_model.py small      # A specific model size
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import MODELS_DIR, WHISPER_MODEL
+
+# Hugging Face names of the Whisper checkpoints ("large" is large-v3, as in faster-whisper)
+HF_MODELS = {
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "medium": "openai/whisper-medium",
+    "large": "openai/whisper-large-v3",
+}
+
+
+def convert_model(model_name: str = WHISPER_MODEL, quantization: str = "int8") -> Path:
+    """
+    Convert a Whisper model with ct2-transformers-converter.
+    
+    Args:
+        model_name: Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
+        quantization: CTranslate2 weight type ('int8', 'int8_float16', 'float16', ...)
+    
+    Returns:
+        Path to the converted model directory
+    """
+    output_dir = MODELS_DIR / f"whisper-{model_name}-ct2"
+    if output_dir.is_dir():
+        print(f"✅ Model already converted: {output_dir}")
+        return output_dir
+    
+    MODELS_DIR.mkdir(exist_ok=True)
+    print(f"🔄 Converting {HF_MODELS[model_name]} ({quantization})...")
+    subprocess.run(
+        [
+            "ct2-transformers-converter",
+            "--model", HF_MODELS[model_name],
+            "--quantization", quantization,
+            # faster-whisper loads the tokenizer and mel settings from the model folder
+            "--copy_files", "tokenizer.json", "preprocessor_config.json",
+            "--output_dir", str(output_dir),
+        ],
+        check=True
+    )
+    
+    print(f"✅ Model saved: {output_dir}")
+    return output_dir
+
+
+if __name__ == "__main__":
+    convert_model(sys.argv[1] if len(sys.argv) > 1 else WHISPER_MODEL)
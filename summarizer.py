@@ -4,15 +4,26 @@ Google Meet Summarizer - Summarization Module
 Handles AI-powered meeting summarization using Google Gemini.
 """
 
-import google.generativeai as genai
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator, Iterable, Union
+import io
 import json
+import re
+import threading
 
 from config import GEMINI_API_KEY, GEMINI_MODEL, SUMMARIES_DIR, SUMMARY_PROMPT
 
 
+# Offline summary patterns, compiled once
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_ACTION_RE = re.compile(
+    r'\b(?:will|should|must|need to|have to|going to|action|task|'
+    r'deadline|complete|finish|do)\b',
+    re.IGNORECASE
+)
+
+
 class Summarizer:
     """
     Generates intelligent meeting summaries using Google Gemini AI.
@@ -37,8 +48,20 @@ class Summarizer:
             api_key: Optional Gemini API key (uses config if not provided)
         """
         self.api_key = api_key or GEMINI_API_KEY
-        self.model = None
-        self._setup_api()
+        self._model = None
+        self._setup_done = False  # API is configured on first use
+        self._setup_lock = threading.Lock()
+        
+    @property
+    def model(self):
+        """The Gemini model, configured on first access."""
+        if not self._setup_done:
+            with self._setup_lock:
+                if not self._setup_done:
+                    self._setup_api()
+                    # Only now: concurrent callers wait for the model instead of seeing None
+                    self._setup_done = True
+        return self._model
         
     def _setup_api(self) -> None:
         """Configure the Gemini API."""
@@ -49,8 +72,10 @@ class Summarizer:
             return
             
         try:
+            # Imported here so importing this module stays cheap
+            import google.generativeai as genai
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(GEMINI_MODEL)
+            self._model = genai.GenerativeModel(GEMINI_MODEL)
             print(f"✅ Gemini API configured successfully!")
         except Exception as e:
             print(f"❌ Failed to configure Gemini API: {e}")
@@ -74,23 +99,45 @@ class Summarizer:
         Returns:
             Generated summary text
         """
+        return "".join(self.summarize_stream(transcript, custom_prompt))
+    
+    def summarize_stream(
+        self, 
+        transcript: str, 
+        custom_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate a summary, yielding text as soon as Gemini produces it.
+        
+        Args:
+            transcript: The meeting transcript text
+            custom_prompt: Optional custom prompt template
+            
+        Yields:
+            Chunks of the generated summary text
+        """
         if not self.is_configured():
-            return self._get_offline_summary(transcript)
+            yield self._get_offline_summary(transcript)
+            return
             
         # Use custom prompt or default
         prompt_template = custom_prompt or SUMMARY_PROMPT
         prompt = prompt_template.format(transcript=transcript)
         
+        received = False
         try:
-            print("🤖 Generating summary with Gemini AI...")
-            response = self.model.generate_content(prompt)
-            summary = response.text
+            print("🤖 Streaming summary from Gemini AI...")
+            for chunk in self.model.generate_content(prompt, stream=True):
+                received = True
+                yield chunk.text
             print("✅ Summary generated successfully!")
-            return summary
             
         except Exception as e:
             print(f"❌ Gemini API error: {e}")
-            return self._get_offline_summary(transcript)
+            if received:
+                yield f"\n\n> ⚠️ Summary interrupted: {e}\n"
+            else:
+                yield self._get_offline_summary(transcript)
     
     def _get_offline_summary(self, transcript: str) -> str:
         """
@@ -103,40 +150,43 @@ class Summarizer:
         # Basic word count and statistics
         words = transcript.split()
         word_count = len(words)
-        sentences = transcript.replace('!', '.').replace('?', '.').split('.')
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentences = [s.strip() for s in _SENTENCE_RE.split(transcript)]
+        sentences = [s for s in sentences if s]
+        sentence_count = len(sentences)
         
-        # Extract potential action items (sentences with action words)
-        action_words = ['will', 'should', 'must', 'need to', 'have to', 'going to', 
-                       'action', 'task', 'deadline', 'complete', 'finish', 'do']
+        # Extract potential action items (sentences with action words);
+        # only the first 5 are shown, so stop scanning once they are found
         potential_actions = []
         for sentence in sentences:
-            if any(word in sentence.lower() for word in action_words):
-                if len(sentence.strip()) > 10:
-                    potential_actions.append(sentence.strip())
+            if len(sentence) > 10 and _ACTION_RE.search(sentence):
+                potential_actions.append(sentence)
+                if len(potential_actions) == 5:
+                    break
         
         # Generate basic summary
-        summary = f"""
-## 📋 Meeting Summary (Offline Mode)
-
-> **Note**: This is a basic summary generated offline. For AI-powered summaries, 
-> please configure your Gemini API key.
-
-### 📊 Statistics
-- **Word Count**: {word_count:,}
-- **Sentences**: {sentence_count}
-- **Estimated Duration**: {word_count // 150} minutes (based on avg. speaking rate)
-
-### 📝 Full Transcript
-{transcript[:1000]}{'...' if len(transcript) > 1000 else ''}
-
-### ✅ Potential Action Items
-{chr(10).join(['- [ ] ' + action[:100] for action in potential_actions[:5]]) or '- No action items detected'}
-
----
-**To get better summaries, configure your Gemini API key!**
-"""
-        return summary
+        buf = io.StringIO()
+        buf.write(
+            "\n## 📋 Meeting Summary (Offline Mode)\n\n"
+            "> **Note**: This is a basic summary generated offline. For AI-powered summaries, \n"
+            "> please configure your Gemini API key.\n\n"
+            "### 📊 Statistics\n"
+        )
+        buf.write(f"- **Word Count**: {word_count:,}\n")
+        buf.write(f"- **Sentences**: {sentence_count}\n")
+        buf.write(f"- **Estimated Duration**: {word_count // 150} minutes (based on avg. speaking rate)\n\n")
+        
+        buf.write("### 📝 Full Transcript\n")
+        buf.write(transcript[:1000])
+        if len(transcript) > 1000:
+            buf.write('...')
+        buf.write("\n\n### ✅ Potential Action Items\n")
+        for action in potential_actions:
+            buf.write(f"- [ ] {action[:100]}\n")
+        if not potential_actions:
+            buf.write("- No action items detected\n")
+        
+        buf.write("\n---\n**To get better summaries, configure your Gemini API key!**\n")
+        return buf.getvalue()
     
     def summarize_and_save(
         self,
@@ -153,25 +203,48 @@ class Summarizer:
         Returns:
             Dictionary with summary and file path
         """
-        # Generate summary
-        summary = self.summarize(transcript)
+        # Write the summary to disk while Gemini streams it
+        return self.save_summary(self.summarize_stream(transcript), meeting_name)
+    
+    def save_summary(
+        self,
+        summary: Union[str, Iterable[str]],
+        meeting_name: Optional[str] = None
+    ) -> Dict:
+        """
+        Save a summary to file.
         
+        Args:
+            summary: Summary text, or an iterable of text chunks (e.g. from
+                     summarize_stream()) that are written as they arrive
+            meeting_name: Optional name for the meeting
+            
+        Returns:
+            Dictionary with summary and file path
+        """
         # Generate filename
         if meeting_name is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             meeting_name = f"summary_{timestamp}"
             
-        # Save as markdown
+        if isinstance(summary, str):
+            summary = [summary]
+            
+        # Save as markdown, flushing each chunk so a crash keeps the partial summary
         md_path = SUMMARIES_DIR / f"{meeting_name}.md"
+        chunks = []
         with open(md_path, 'w', encoding='utf-8') as f:
             f.write(f"# Meeting Summary: {meeting_name}\n")
             f.write(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(summary)
+            for chunk in summary:
+                f.write(chunk)
+                f.flush()
+                chunks.append(chunk)
             
         print(f"📄 Summary saved: {md_path}")
         
         return {
-            "summary": summary,
+            "summary": "".join(chunks),
             "file_path": str(md_path),
             "meeting_name": meeting_name
         }